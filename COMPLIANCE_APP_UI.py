@@ -3,14 +3,7 @@ import tempfile
 import base64
 from PIL import Image
 
-from COMPLIANCE_HELPER_FUNCTIONS import (
-    EXTRACT_TEXT_FROM_FILE,
-    EXTRACT_EDUCATION_COMPLIANCE_APPLICATION,
-    EXTRACT_EDUCATION_AMA_PROFILE,
-    EXTRACT_BOARDS_COMPLIANCE_APPLICATION,
-    EXTRACT_BOARDS_AMA_PROFILE,
-    COMPARE_INFORMATION,
-)
+from COMPLIANCE_HELPER_FUNCTIONS import RUN_VERIFICATION
 
 # Compliance UI page config
 st.set_page_config(page_title="Compliance Watchdog Verification", layout="centered")
@@ -247,6 +240,11 @@ AMA_PROFILE_FILE = st.file_uploader(
     "Upload AMA Profile", type=["png", "jpg", "jpeg", "pdf", "txt", "docx"]
 )
 
+# Optional faster AMA PDF extraction that only OCRs the education and board pages
+SECTION_AWARE_AMA = st.checkbox(
+    "Fast AMA PDF scan (only OCR pages with education and board sections)", value=False
+)
+
 # Button to trigger verification proccess
 if st.button("✅ Verify Documents ✅"):
     if COMPLIANCE_APPLICATION_FILE is None or AMA_PROFILE_FILE is None:
@@ -272,16 +270,13 @@ if st.button("✅ Verify Documents ✅"):
             COMPLIANCE_PATH = SAVE_UPLOADED_FILE(COMPLIANCE_APPLICATION_FILE, COMPLIANCE_SUFFIX)
             AMA_PATH = SAVE_UPLOADED_FILE(AMA_PROFILE_FILE, AMA_SUFFIX)
 
-            COMPLIANCE_TEXT = EXTRACT_TEXT_FROM_FILE(COMPLIANCE_PATH)
-            AMA_TEXT = EXTRACT_TEXT_FROM_FILE(AMA_PATH)
-
-            COMPLIANCE_EDUCATION_ENTRIES = EXTRACT_EDUCATION_COMPLIANCE_APPLICATION(COMPLIANCE_TEXT)
-            AMA_EDUCATION_ENTRIES = EXTRACT_EDUCATION_AMA_PROFILE(AMA_TEXT)
+            # Both documents are extracted and parsed concurrently before comparison
+            VERIFICATION = RUN_VERIFICATION(COMPLIANCE_PATH, AMA_PATH, SECTION_AWARE_AMA=SECTION_AWARE_AMA)
 
-            COMPLIANCE_BOARD_ENTRIES = EXTRACT_BOARDS_COMPLIANCE_APPLICATION(COMPLIANCE_TEXT)
-            AMA_BOARD_ENTRIES = EXTRACT_BOARDS_AMA_PROFILE(AMA_TEXT)
+            COMPLIANCE_EDUCATION_ENTRIES = VERIFICATION["application"]["education"]
+            AMA_EDUCATION_ENTRIES = VERIFICATION["ama"]["education"]
 
-            MATCHES = COMPARE_INFORMATION(COMPLIANCE_EDUCATION_ENTRIES, AMA_EDUCATION_ENTRIES, COMPLIANCE_BOARD_ENTRIES, AMA_BOARD_ENTRIES)
+            MATCHES = VERIFICATION["matches"]
 
             if not COMPLIANCE_EDUCATION_ENTRIES:
                 st.error("No education entries found in the compliance application.")
@@ -335,4 +330,16 @@ if st.button("✅ Verify Documents ✅"):
                         st.info(f"ℹ️ Explanation: {BOARD_RESULT.get('explanation', 'Board entry matches AMA profile exactly.')}")
                     else:
                         st.error("❌ No matching board certification found")
-                        st.warning(f"⚠️ Explanation: {BOARD_RESULT.get('explanation', 'No matching board entry in AMA profile.')}")
\ No newline at end of file
+                        st.warning(f"⚠️ Explanation: {BOARD_RESULT.get('explanation', 'No matching board entry in AMA profile.')}")
+
+            # Record which AMA profile pages were OCR'd so the page selection can be audited
+            AMA_PAGE_AUDIT = VERIFICATION["ama"]["pages"]
+            AMA_SECTION_STATE = VERIFICATION["ama"]["sections"]
+            if AMA_PAGE_AUDIT:
+                with st.expander("📄 AMA Profile Pages Used 📄"):
+                    for SECTION_NAME, SECTION_STATUS in AMA_SECTION_STATE.items():
+                        st.markdown(f"- Section {SECTION_NAME.title()}: {SECTION_STATUS}")
+
+                    for PAGE_ENTRY in AMA_PAGE_AUDIT:
+                        PAGE_STATUS = "✅ Used" if PAGE_ENTRY["used"] else "⏭️ Skipped"
+                        st.markdown(f"- Page {PAGE_ENTRY['page']}: {PAGE_STATUS} ({PAGE_ENTRY['reason']})")
\ No newline at end of file
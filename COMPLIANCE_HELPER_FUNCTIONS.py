@@ -3,8 +3,11 @@ import mimetypes
 import datetime
 import docx
 import re
+import subprocess
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 from transformers import pipeline
 from sentence_transformers import SentenceTransformer, util
 
@@ -14,21 +17,176 @@ LLM_PIPELINE = pipeline("text2text-generation", model="google/flan-t5-base")
 # Load/Initialize embedding model globally
 EMBEDDING_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
 
+# Supported date layouts, tried in order: MM/DD/YYYY, MM/DD/YY, YYYY/MM/DD
+DATE_PATTERNS = [
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$'), "MDY"),
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2})$'), "MDy"),
+    (re.compile(r'^(\d{4})/(\d{1,2})/(\d{1,2})$'), "YMD"),
+]
+
+# Ordinal used for dates that could not be parsed (real ordinals start at 1)
+NO_DATE_ORDINAL = 0
+
 # Normalizes expiration date strings into a standard date object
 def NORMALIZE_DATE(DATE_STR):
     DATE_STR = str(DATE_STR).strip()
     DATE_STR = DATE_STR.replace("-", "/")
-    FORMATS = ["%m/%d/%Y", "%m/%d/%y", "%Y/%m/%d", "%m/%d/%Y", "%m/%d/%y"]
 
-    for FMT in FORMATS:
+    for PATTERN, LAYOUT in DATE_PATTERNS:
+        DATE_MATCH = PATTERN.match(DATE_STR)
+        if not DATE_MATCH:
+            continue
+
+        if LAYOUT == "YMD":
+            YEAR, MONTH, DAY = (int(PART) for PART in DATE_MATCH.groups())
+        else:
+            MONTH, DAY, YEAR = (int(PART) for PART in DATE_MATCH.groups())
+            if LAYOUT == "MDy":
+                YEAR += 2000 if YEAR < 69 else 1900
+
         try:
-            return datetime.datetime.strptime(DATE_STR, FMT).date()
-        
-        except Exception:
+            return datetime.date(YEAR, MONTH, DAY)
+
+        except ValueError:
             continue
 
     return DATE_STR
 
+# Converts a date string into an integer ordinal (NO_DATE_ORDINAL when unparseable)
+def DATE_TO_ORDINAL(DATE_STR):
+    DATE_VALUE = NORMALIZE_DATE(DATE_STR)
+    return DATE_VALUE.toordinal() if isinstance(DATE_VALUE, datetime.date) else NO_DATE_ORDINAL
+
+# --------------- RECORD TYPES --------------- #
+
+# Base read-only record with dict-style access so parsed entries keep working with the UI and explanations
+class COMPLIANCE_RECORD:
+    __slots__ = ()
+    FIELDS = {}
+
+    # Records are read-only so comparison keys precomputed at parse time never go stale
+    def __setattr__(self, NAME, VALUE):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, NAME):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def SET_FIELDS(self, **VALUES):
+        for NAME, VALUE in VALUES.items():
+            object.__setattr__(self, NAME, VALUE)
+
+    def __getitem__(self, KEY):
+        if KEY not in self.FIELDS:
+            raise KeyError(KEY)
+        return getattr(self, self.FIELDS[KEY])
+
+    def __contains__(self, KEY):
+        return KEY in self.FIELDS and getattr(self, self.FIELDS[KEY]) is not None
+
+    def get(self, KEY, DEFAULT=None):
+        VALUE = getattr(self, self.FIELDS[KEY]) if KEY in self.FIELDS else None
+        return DEFAULT if VALUE is None else VALUE
+
+    def keys(self):
+        return [KEY for KEY in self.FIELDS if KEY in self]
+
+    def items(self):
+        return [(KEY, self[KEY]) for KEY in self.keys()]
+
+    def TO_DICT(self):
+        return dict(self.items())
+
+    def __eq__(self, OTHER):
+        if isinstance(OTHER, (COMPLIANCE_RECORD, dict)):
+            return self.TO_DICT() == dict(OTHER.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.TO_DICT())
+
+# Single education entry
+class EDUCATION_RECORD(COMPLIANCE_RECORD):
+    __slots__ = ("INSTITUTION", "PROGRAM", "SPECIALTY", "START_DATE", "END_DATE")
+    FIELDS = {
+        "Institution": "INSTITUTION",
+        "Program": "PROGRAM",
+        "Specialty": "SPECIALTY",
+        "Start Date": "START_DATE",
+        "End Date": "END_DATE",
+    }
+
+    def __init__(self, PROGRAM, SPECIALTY, START_DATE, END_DATE, INSTITUTION=None):
+        self.SET_FIELDS(
+            INSTITUTION=INSTITUTION,
+            PROGRAM=PROGRAM,
+            SPECIALTY=SPECIALTY,
+            START_DATE=START_DATE,
+            END_DATE=END_DATE
+        )
+
+# Single board certification entry, with comparison keys precomputed at parse time
+class BOARD_RECORD(COMPLIANCE_RECORD):
+    __slots__ = ("BOARD_NAME", "STATUS", "EXPIRATION_DATE", "BOARD_KEY", "STATUS_KEY", "EXPIRATION_KEY", "EXPIRATION_ORDINAL")
+    FIELDS = {
+        "Board Name": "BOARD_NAME",
+        "Status": "STATUS",
+        "Expiration Date": "EXPIRATION_DATE",
+    }
+
+    def __init__(self, BOARD_NAME, STATUS, EXPIRATION_DATE):
+        EXPIRATION_KEY = str(EXPIRATION_DATE or "").strip().replace("-", "/")
+        self.SET_FIELDS(
+            BOARD_NAME=BOARD_NAME,
+            STATUS=STATUS,
+            EXPIRATION_DATE=EXPIRATION_DATE,
+            BOARD_KEY=(BOARD_NAME or "").strip().lower(),
+            STATUS_KEY=(STATUS or "").strip().lower(),
+            EXPIRATION_KEY=EXPIRATION_KEY,
+            EXPIRATION_ORDINAL=DATE_TO_ORDINAL(EXPIRATION_KEY)
+        )
+
+    # Compares status and expiration against another board using the precomputed keys
+    def FIELDS_MATCH(self, OTHER):
+        if self.STATUS_KEY != OTHER.STATUS_KEY:
+            return False
+
+        # Unparseable dates only match when their raw text is identical
+        if self.EXPIRATION_ORDINAL == NO_DATE_ORDINAL or OTHER.EXPIRATION_ORDINAL == NO_DATE_ORDINAL:
+            return self.EXPIRATION_ORDINAL == OTHER.EXPIRATION_ORDINAL and self.EXPIRATION_KEY == OTHER.EXPIRATION_KEY
+
+        return self.EXPIRATION_ORDINAL == OTHER.EXPIRATION_ORDINAL
+
+# Wraps a plain dict entry (or passes through an existing record) as a BOARD_RECORD
+def AS_BOARD_RECORD(ENTRY):
+    if isinstance(ENTRY, BOARD_RECORD):
+        return ENTRY
+    return BOARD_RECORD(ENTRY.get("Board Name", ""), ENTRY.get("Status", ""), ENTRY.get("Expiration Date", ""))
+
+# Builds a columnar (NumPy) view of board records for bulk runs
+def BOARD_COLUMNS(BOARD_RECORDS):
+    return {
+        "Status": np.array([RECORD.STATUS_KEY for RECORD in BOARD_RECORDS], dtype=str),
+        "Expiration Key": np.array([RECORD.EXPIRATION_KEY for RECORD in BOARD_RECORDS], dtype=str),
+        "Expiration Ordinal": np.array([RECORD.EXPIRATION_ORDINAL for RECORD in BOARD_RECORDS], dtype=np.int64),
+    }
+
+# Compares status and expiration for every (application, AMA) board pair in one pass
+def BOARD_FIELD_MATCHES(APP_COLUMNS, AMA_COLUMNS):
+    STATUS_MATCHES = APP_COLUMNS["Status"][:, None] == AMA_COLUMNS["Status"][None, :]
+
+    APP_ORDINALS = APP_COLUMNS["Expiration Ordinal"][:, None]
+    AMA_ORDINALS = AMA_COLUMNS["Expiration Ordinal"][None, :]
+    PARSED_MATCHES = (APP_ORDINALS == AMA_ORDINALS) & (APP_ORDINALS != NO_DATE_ORDINAL)
+
+    # Unparseable dates only match when their raw text is identical
+    UNPARSED_MATCHES = (
+        (APP_ORDINALS == NO_DATE_ORDINAL)
+        & (AMA_ORDINALS == NO_DATE_ORDINAL)
+        & (APP_COLUMNS["Expiration Key"][:, None] == AMA_COLUMNS["Expiration Key"][None, :])
+    )
+
+    return STATUS_MATCHES, PARSED_MATCHES | UNPARSED_MATCHES
+
 # Toggle between RULE_BASED and LLM explanations
 USE_LLM_EXPLANATIONS = True
 
@@ -159,12 +317,7 @@ def EXTRACT_EDUCATION_COMPLIANCE_APPLICATION(FILE_CONTENT):
                 END_DATE = END_DATE_MATCH.group(1).strip()
 
             if all([PROGRAM, SPECIALTY, START_DATE, END_DATE]):
-                ENTRIES.append({
-                    "Program": PROGRAM,
-                    "Specialty": SPECIALTY,
-                    "Start Date": START_DATE,
-                    "End Date": END_DATE
-                })
+                ENTRIES.append(EDUCATION_RECORD(PROGRAM, SPECIALTY, START_DATE, END_DATE))
 
         return ENTRIES
     
@@ -189,13 +342,13 @@ def EXTRACT_EDUCATION_AMA_PROFILE(FILE_CONTENT):
         )
 
         for institution, program, specialty, start_date, end_date in BLOCKS:
-            ENTRIES.append({
-                "Institution": institution.strip(),
-                "Program": program.strip(),
-                "Specialty": specialty.strip(),
-                "Start Date": start_date,
-                "End Date": end_date
-            })
+            ENTRIES.append(EDUCATION_RECORD(
+                program.strip(),
+                specialty.strip(),
+                start_date,
+                end_date,
+                INSTITUTION=institution.strip()
+            ))
         
         return ENTRIES
     
@@ -219,11 +372,7 @@ def EXTRACT_BOARDS_COMPLIANCE_APPLICATION(FILE_CONTENT):
             EXPIRATION = EXP_MATCH.group(1).strip() if EXP_MATCH else None
 
             if BOARD_NAME and STATUS and EXPIRATION:
-                ENTRIES.append({
-                    "Board Name": BOARD_NAME,
-                    "Status": STATUS,
-                    "Expiration Date": EXPIRATION
-                })
+                ENTRIES.append(BOARD_RECORD(BOARD_NAME, STATUS, EXPIRATION))
 
         return ENTRIES
 
@@ -248,17 +397,126 @@ def EXTRACT_BOARDS_AMA_PROFILE(FILE_CONTENT):
                 BOARD_NAME = f"{BOARD_NAME_MATCH.group(1).strip()} - {CERT_MATCH.group(1).strip()}"
                 STATUS = STATUS_MATCH.group(1).strip()
                 EXPIRATION = EXP_MATCH.group(1).strip()
-                ENTRIES.append({
-                    "Board Name": BOARD_NAME,
-                    "Status": STATUS,
-                    "Expiration Date": EXPIRATION
-                })
+                ENTRIES.append(BOARD_RECORD(BOARD_NAME, STATUS, EXPIRATION))
             
         return ENTRIES
 
     except Exception:
         return []
 
+# --------------- SECTION-AWARE OCR FUNCTIONS --------------- #
+
+# Each AMA profile section: the anchor that starts it, the field labels that continue it, and its parser
+AMA_PROFILE_SECTIONS = {
+    "education": (
+        re.compile(r'Sponsoring\s*Institution|Program\s*name', re.IGNORECASE),
+        re.compile(r'Sponsoring\s*Institution|Program\s*name|Specialty|Dates', re.IGNORECASE),
+        EXTRACT_EDUCATION_AMA_PROFILE
+    ),
+    "boards": (
+        re.compile(r'Certifying\s*board', re.IGNORECASE),
+        re.compile(r'Certifying\s*board|Certificate|Duration\s*Status|Expir|\d{2}/\d{2}/\d{4}', re.IGNORECASE),
+        EXTRACT_BOARDS_AMA_PROFILE
+    ),
+}
+
+# Resolution of the cheap preview render used by the blank and no-anchor checks
+PREVIEW_DPI = 150
+
+# Grayscale level below which a preview pixel counts as ink
+INK_THRESHOLD = 160
+
+# Pages whose share of ink pixels is below this are treated as blank (tolerates scanner speckle)
+BLANK_PAGE_INK_RATIO = 0.0001
+
+# Cheap blank-page check on the low-resolution preview render
+def IS_BLANK_PAGE(PREVIEW):
+    HISTOGRAM = PREVIEW.convert("L").histogram()
+    return sum(HISTOGRAM[:INK_THRESHOLD]) / max(sum(HISTOGRAM), 1) < BLANK_PAGE_INK_RATIO
+
+# Reads the PDF's embedded text layer per page (empty strings when the PDF is a pure scan)
+def READ_PDF_TEXT_LAYER(PDF_PATH, PAGE_COUNT):
+    try:
+        RESULT = subprocess.run(["pdftotext", "-layout", PDF_PATH, "-"], capture_output=True, text=True, check=True)
+        PAGES = RESULT.stdout.split("\f")
+        return [PAGES[INDEX] if INDEX < len(PAGES) else "" for INDEX in range(PAGE_COUNT)]
+
+    except Exception:
+        return [""] * PAGE_COUNT
+
+# Cheap no-anchor check: the text layer when present, otherwise OCR of the low-resolution preview
+def PREVIEW_PAGE_TEXT(PREVIEW, TEXT_LAYER_PAGE):
+    if TEXT_LAYER_PAGE.strip():
+        return TEXT_LAYER_PAGE
+    return pytesseract.image_to_string(PREVIEW)
+
+# OCRs only the PDF pages needed for the expected sections, stopping once every section is complete
+def OCR_PDF_SECTIONS(PDF_PATH, SECTIONS=AMA_PROFILE_SECTIONS):
+    try:
+        PAGE_COUNT = pdfinfo_from_path(PDF_PATH)["Pages"]
+        TEXT_LAYER = READ_PDF_TEXT_LAYER(PDF_PATH, PAGE_COUNT)
+        PDF_CONTENT = ""
+        PAGE_AUDIT = []
+        SECTION_STATE = {NAME: "pending" for NAME in SECTIONS}
+
+        for PAGE_NUMBER in range(1, PAGE_COUNT + 1):
+            if all(STATE == "complete" for STATE in SECTION_STATE.values()):
+                PAGE_AUDIT.extend(
+                    {"page": SKIPPED, "used": False, "reason": "sections_complete"}
+                    for SKIPPED in range(PAGE_NUMBER, PAGE_COUNT + 1)
+                )
+                break
+
+            # The cheap checks only decide whether to skip, and never apply while a section may continue onto the page
+            if "open" not in SECTION_STATE.values():
+                PREVIEW = convert_from_path(PDF_PATH, dpi=PREVIEW_DPI, first_page=PAGE_NUMBER, last_page=PAGE_NUMBER)[0]
+
+                if IS_BLANK_PAGE(PREVIEW):
+                    PAGE_AUDIT.append({"page": PAGE_NUMBER, "used": False, "reason": "blank"})
+                    continue
+
+                PREVIEW_TEXT = PREVIEW_PAGE_TEXT(PREVIEW, TEXT_LAYER[PAGE_NUMBER - 1])
+                if not any(ANCHOR.search(PREVIEW_TEXT) for ANCHOR, _, _ in SECTIONS.values()):
+                    PAGE_AUDIT.append({"page": PAGE_NUMBER, "used": False, "reason": "no_anchor"})
+                    continue
+
+            PAGE = convert_from_path(PDF_PATH, dpi=300, first_page=PAGE_NUMBER, last_page=PAGE_NUMBER)[0]
+            PAGE_TEXT = pytesseract.image_to_string(PAGE).strip()
+            if not PAGE_TEXT:
+                PAGE_AUDIT.append({"page": PAGE_NUMBER, "used": False, "reason": "empty"})
+                continue
+
+            PDF_CONTENT += PAGE_TEXT + "\n"
+            PAGE_AUDIT.append({"page": PAGE_NUMBER, "used": True, "reason": "section_content"})
+
+            # A section ends on the first page that carries none of its field labels, once it has parsed entries
+            for NAME, (ANCHOR, CONTENT, PARSER) in SECTIONS.items():
+                if ANCHOR.search(PAGE_TEXT):
+                    SECTION_STATE[NAME] = "open"
+                elif SECTION_STATE[NAME] == "open" and not CONTENT.search(PAGE_TEXT) and PARSER(PDF_CONTENT):
+                    SECTION_STATE[NAME] = "complete"
+
+        # A section that runs to the last page is complete; one never found falls back to full OCR
+        SECTION_STATE = {NAME: "complete" if STATE == "open" else STATE for NAME, STATE in SECTION_STATE.items()}
+        if "pending" in SECTION_STATE.values():
+            return {
+                "text": OCR_PDF(PDF_PATH),
+                "pages": [
+                    {"page": PAGE_NUMBER, "used": True, "reason": "full_ocr_fallback"}
+                    for PAGE_NUMBER in range(1, PAGE_COUNT + 1)
+                ],
+                "sections": {NAME: "not_found" if STATE == "pending" else STATE for NAME, STATE in SECTION_STATE.items()}
+            }
+
+        return {
+            "text": PDF_CONTENT,
+            "pages": PAGE_AUDIT,
+            "sections": SECTION_STATE
+        }
+
+    except Exception as e:
+        return {"text": f"OCR_ERROR: {str(e)}", "pages": [], "sections": {}}
+
 # --------------- COMPARISON FUNCTIONS --------------- #
 
 # AI-based similarity score calculation
@@ -315,29 +573,16 @@ def COMPARE_INFORMATION(APPLICATION_EDU_DATA=None, AMA_EDU_DATA=None, APPLICATIO
             })
 
         # --- BOARDS COMPARISON ---
-        for APP_BOARD in APPLICATION_BOARD_DATA or []:
+        APP_BOARDS = [AS_BOARD_RECORD(ENTRY) for ENTRY in APPLICATION_BOARD_DATA or []]
+        AMA_BOARDS = [AS_BOARD_RECORD(ENTRY) for ENTRY in AMA_BOARD_DATA or []]
+
+        for APP_BOARD in APP_BOARDS:
             MATCH_FOUND = False
             EXPLANATION = None
 
-            for AMA_BOARD in AMA_BOARD_DATA or []:
-                BOARD_SCORE = EMBEDDING_SIMILARITY(
-                    (APP_BOARD.get("Board Name", "") or "").strip().lower(),
-                    (AMA_BOARD.get("Board Name", "") or "").strip().lower()
-                )
-                STATUS_MATCH = (APP_BOARD.get("Status", "") or "").strip().lower() == (AMA_BOARD.get("Status", "") or "").strip().lower()
-
-                APP_DATE_STR = str(APP_BOARD.get("Expiration Date", "")).strip()
-                AMA_DATE_STR = str(AMA_BOARD.get("Expiration Date", "")).strip()
-                APP_DATE = NORMALIZE_DATE(APP_DATE_STR)
-                AMA_DATE = NORMALIZE_DATE(AMA_DATE_STR)
-                DATE_MATCH = False
-                try:
-                    DATE_MATCH = APP_DATE == AMA_DATE
-                
-                except Exception:
-                    DATE_MATCH = False
-
-                if BOARD_SCORE >= threshold and STATUS_MATCH and DATE_MATCH:
+            for AMA_BOARD in AMA_BOARDS:
+                # Embedding similarity is only worth computing once status and expiration agree
+                if APP_BOARD.FIELDS_MATCH(AMA_BOARD) and EMBEDDING_SIMILARITY(APP_BOARD.BOARD_KEY, AMA_BOARD.BOARD_KEY) >= threshold:
                     MATCH_FOUND = True
                     EXPLANATION = GENERATE_EXPLANATION("board", APP_BOARD, AMA_BOARD, True)
                     break
@@ -356,4 +601,75 @@ def COMPARE_INFORMATION(APPLICATION_EDU_DATA=None, AMA_EDU_DATA=None, APPLICATIO
         return RESULTS
 
     except Exception as E:
-        return {"education": [], "boards": [], "error": str(E)}
\ No newline at end of file
+        return {"education": [], "boards": [], "error": str(E)}
+
+# Bulk board comparison: returns a boolean (application x AMA) match matrix using the columnar form
+def COMPARE_BOARDS_BULK(APPLICATION_BOARD_DATA, AMA_BOARD_DATA, threshold=0.75):
+    APP_BOARDS = [AS_BOARD_RECORD(ENTRY) for ENTRY in APPLICATION_BOARD_DATA or []]
+    AMA_BOARDS = [AS_BOARD_RECORD(ENTRY) for ENTRY in AMA_BOARD_DATA or []]
+
+    STATUS_MATCHES, DATE_MATCHES = BOARD_FIELD_MATCHES(BOARD_COLUMNS(APP_BOARDS), BOARD_COLUMNS(AMA_BOARDS))
+    FIELD_MATCHES = STATUS_MATCHES & DATE_MATCHES
+
+    if not FIELD_MATCHES.any():
+        return FIELD_MATCHES
+
+    # Each board name is encoded once and all pairs are scored in a single similarity matrix
+    APP_EMBEDDINGS = EMBEDDING_MODEL.encode([RECORD.BOARD_KEY for RECORD in APP_BOARDS], convert_to_tensor=True)
+    AMA_EMBEDDINGS = EMBEDDING_MODEL.encode([RECORD.BOARD_KEY for RECORD in AMA_BOARDS], convert_to_tensor=True)
+    NAME_SCORES = util.cos_sim(APP_EMBEDDINGS, AMA_EMBEDDINGS).cpu().numpy()
+
+    return FIELD_MATCHES & (NAME_SCORES >= threshold)
+
+# --------------- VERIFICATION FUNCTIONS --------------- #
+
+# Extracts and parses the education and board entries of the compliance application
+def PARSE_COMPLIANCE_APPLICATION(FILE_PATH):
+    FILE_CONTENT = EXTRACT_TEXT_FROM_FILE(FILE_PATH)
+    return {
+        "education": EXTRACT_EDUCATION_COMPLIANCE_APPLICATION(FILE_CONTENT),
+        "boards": EXTRACT_BOARDS_COMPLIANCE_APPLICATION(FILE_CONTENT)
+    }
+
+# Extracts and parses the education and board entries of the AMA profile
+def PARSE_AMA_PROFILE(FILE_PATH, SECTION_AWARE=False):
+    PAGE_AUDIT = SECTION_STATE = None
+    MIME_TYPE, _ = mimetypes.guess_type(FILE_PATH)
+
+    if SECTION_AWARE and MIME_TYPE == "application/pdf":
+        OCR_RESULT = OCR_PDF_SECTIONS(FILE_PATH)
+        FILE_CONTENT = OCR_RESULT["text"]
+        PAGE_AUDIT = OCR_RESULT["pages"]
+        SECTION_STATE = OCR_RESULT["sections"]
+    else:
+        FILE_CONTENT = EXTRACT_TEXT_FROM_FILE(FILE_PATH)
+
+    return {
+        "education": EXTRACT_EDUCATION_AMA_PROFILE(FILE_CONTENT),
+        "boards": EXTRACT_BOARDS_AMA_PROFILE(FILE_CONTENT),
+        "pages": PAGE_AUDIT,
+        "sections": SECTION_STATE
+    }
+
+# Extracts and parses both documents concurrently, then compares them once both are ready
+def RUN_VERIFICATION(COMPLIANCE_APPLICATION_PATH, AMA_PROFILE_PATH, threshold=0.75, SECTION_AWARE_AMA=False):
+    # Tesseract runs as a subprocess, so threads overlap the OCR of both documents
+    with ThreadPoolExecutor(max_workers=2) as EXECUTOR:
+        APPLICATION_FUTURE = EXECUTOR.submit(PARSE_COMPLIANCE_APPLICATION, COMPLIANCE_APPLICATION_PATH)
+        AMA_FUTURE = EXECUTOR.submit(PARSE_AMA_PROFILE, AMA_PROFILE_PATH, SECTION_AWARE_AMA)
+        APPLICATION_ENTRIES = APPLICATION_FUTURE.result()
+        AMA_ENTRIES = AMA_FUTURE.result()
+
+    MATCHES = COMPARE_INFORMATION(
+        APPLICATION_ENTRIES["education"],
+        AMA_ENTRIES["education"],
+        APPLICATION_ENTRIES["boards"],
+        AMA_ENTRIES["boards"],
+        threshold=threshold
+    )
+
+    return {
+        "application": APPLICATION_ENTRIES,
+        "ama": AMA_ENTRIES,
+        "matches": MATCHES
+    }